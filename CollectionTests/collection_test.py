@@ -17,6 +17,9 @@ DB_PASSWORD = os.environ.get("DB_PASSWORD")
 
 API_KEY = os.environ.get("API_KEY")
 
+# One keep-alive connection to Riot for the whole run instead of a new TLS handshake per match
+session = requests.Session()
+
 count_file = "collection_count.json"
 
 def get_game_count():
@@ -33,48 +36,55 @@ def update_request_count(count):
 
 def data(id,key,retries=3):
     match_data = None
-    #recursive limit
-    if retries <= 0:
-        logging.error(f"Error {match_data['status']['status_code']}: {match_data['status']['message']} From url: {url}")
-        return(match_data)
+    url = ('https://americas.api.riotgames.com/lol/match/v5/matches/'+
+            id +'?api_key=' + key)
 
-    try:
-    #request match data
-        url = ('https://americas.api.riotgames.com/lol/match/v5/matches/'+
-                id +'?api_key=' + key)
-        response = requests.get(url)
-        match_data = response.json()
+    for attempt in range(retries):
+        try:
+        #request match data
+            response = session.get(url, timeout=10)
+
+            #server and rate limit errors - wait and retry unless this was the last attempt
+            if response.status_code >= 429 and attempt < retries - 1:
+                time.sleep(120)
+                continue
 
-    except requests.exceptions.RequestException as e:
-        logging.error(f"An error occurred: {e}", exc_info=True)
-        return None
+            #success, or an error whose status body the caller records - only parsed once we keep it
+            match_data = response.json()
 
-    #check for response errors
-    try:
-        #server and rate limit errors
-        if match_data['status']['status_code'] >= 429:
-            time.sleep(120)
-            return(data(id,key,retries-1))
-        else:
-            return(match_data)
-
-    #keyError because working with dictionaries ([status])
-    except KeyError:
+        except requests.exceptions.RequestException as e:
+            logging.error(f"An error occurred: {e}", exc_info=True)
+            return None
+
+        if response.status_code >= 429:
+            logging.error(f"Error {response.status_code}: {response.text} From url: {url}")
         return(match_data)
+
+    return(match_data)
     
-def upload_to_mysql(data, db_config):
+def upload_to_mysql(data, db_config, batch_size=1000):
+    connection = None
+    cursor = None
     try:
-        # Create a connection to the MySQL database
+        # One connection for every batch, but each batch commits on its own: the games were
+        # already counted by update_request_count, so a failed batch must not take the rest with it
         connection = mysql.connector.connect(**db_config)
         cursor = connection.cursor()
 
-        sql_utils.insert_data_to_mysql(cursor, 'collectionTest', data)
-        connection.commit()
+        for i in range(0, len(data), batch_size):
+            try:
+                sql_utils.insert_data_to_mysql(cursor, 'collectionTest', data[i:i + batch_size])
+                connection.commit()
+            except mysql.connector.Error as err:
+                logging.error(f"MySQL Error in batch starting at row {i}: {err}", exc_info=True)
+                connection.rollback()
     except mysql.connector.Error as err:
         logging.error(f"MySQL Error: {err}", exc_info=True)
     finally:
-        cursor.close()
-        connection.close()
+        if cursor is not None:
+            cursor.close()
+        if connection is not None:
+            connection.close()
 
 def main():
     game_number = get_game_count()
@@ -126,10 +136,7 @@ def main():
 
     finally:
         update_request_count(game_number)
-        batch_size = 1000
-        for i in range(0, len(matches), batch_size):
-            batch = matches[i:i + batch_size]  # Slice the list to get the batch
-            upload_to_mysql(batch, db_config)  # Upload the current batch
+        upload_to_mysql(matches, db_config)  # Uploads in 1000-row batches over one connection
         
 
             
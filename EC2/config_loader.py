@@ -9,5 +9,7 @@ def load_config():
         "source": os.environ.get("source", 'prod'),
         "API_KEY": os.environ.get("API_KEY"),
         "BUCKET": os.environ.get("BUCKET"),
-        "API_KEY_EXPIRATION": os.environ.get("API_KEY_EXPIRATION")
+        "API_KEY_EXPIRATION": os.environ.get("API_KEY_EXPIRATION"),
+        "FETCH_BATCH_SIZE": int(os.environ.get("FETCH_BATCH_SIZE", 50)),
+        "FETCH_CONCURRENCY": int(os.environ.get("FETCH_CONCURRENCY", 20))
     }
\ No newline at end of file
@@ -5,7 +5,7 @@ import psutil
 # Test imports immediately and catch any import errors
 try:
     print("Testing imports...")
-    from Utils.api import highElo, LowElo, matchList, handle_api_response 
+    from Utils.api import highElo, LowElo, fetch_match_lists, handle_api_response, call_when_breaker_allows 
     from Utils.S3 import upload_to_s3
     from Utils.logger import get_logger
     logger = get_logger(__name__)
@@ -29,7 +29,7 @@ def run_fetcher(config):
 
     low_elo_players = []
     high_elo_players = []
-    matchesList = []
+    uniqueMatches = set()  # Players in the same games return the same ids - dedupe as we go
     ranks = ['challenger', 'grandmaster', 'master']  
     divisions = ['I', 'II', 'III', 'IV']
     tiers = ['DIAMOND']
@@ -40,7 +40,7 @@ def run_fetcher(config):
         print("Fetching high elo players...")
         for rank in ranks:
             print(f"  Fetching {rank} players...")
-            json_response = highElo(rank, config['API_KEY'])
+            json_response = call_when_breaker_allows(highElo, rank, config['API_KEY'])
             if json_response and 'entries' in json_response:
                 tier = json_response['tier']
                 for entry in json_response['entries']:
@@ -66,7 +66,7 @@ def run_fetcher(config):
                     print(f"  Fetching {tier} {division} players...")
                     page = 1
                     while True:
-                        json_response = LowElo(tier, division, page, config['API_KEY'])
+                        json_response = call_when_breaker_allows(LowElo, tier, division, page, config['API_KEY'])
                         if json_response:
                             low_elo_players.extend(json_response)
                             page += 1
@@ -108,32 +108,35 @@ def run_fetcher(config):
     print(f"Created rank mapping for {len(player_rank_map)} players")
     print("Fetching match lists...")
 
+    puuids = []
+    for i, player in enumerate(ranked_players):
+        puuid = player.get('puuid')
+        if not puuid:
+            print(f"No puuid found for player {i}")
+            continue
+        puuids.append(puuid)
+
+    i = 0
     try:
         match_count = 0
-        for i, player in enumerate(ranked_players):
-            puuid = player.get('puuid')
-            if not puuid:
-                print(f"No puuid found for player {i}")
-                continue
-                
+        # Requests run concurrently on the shared session; results still arrive in player order
+        for i, (puuid, tempMatches) in enumerate(fetch_match_lists(puuids, config['API_KEY'], config['start_epoch'], config['end_epoch'], config['FETCH_CONCURRENCY'])):
             # Progress indicator every 1000 players
             if i % 1000 == 0:
-                print(f"  Progress: {i}/{len(ranked_players)} players processed, {match_count} matches found")
-                
-            tempMatches = matchList(player['puuid'], config['API_KEY'], config['start_epoch'], config['end_epoch'])
+                print(f"  Progress: {i}/{len(puuids)} players processed, {match_count} matches found")
+
             if isinstance(tempMatches, list):
-                matchesList.extend(tempMatches)
+                uniqueMatches.update(tempMatches)
                 match_count += len(tempMatches)
             else:
-                handle_api_response(tempMatches, func_name='matchList', player_id=player['puuid'])
+                handle_api_response(tempMatches, func_name='matchList', player_id=puuid)
     except Exception as e:
         logger.error(f"❌ CRITICAL ERROR during matchList request: {e}")
-        print(f"🛑 Matchlist generation failed at player {i}/{len(ranked_players)}")
+        print(f"🛑 Matchlist generation failed at player {i}/{len(puuids)}")
         print(f"📋 Incomplete matchlist would be useless - backfill required")
         print(f"📋 Manual intervention required: Check API key and Riot API status")
         sys.exit(1)
 
-    uniqueMatches = set(matchesList)
     print(f"Found {len(uniqueMatches)} unique matches to process")
 
     key = f'backfill/matchlists/match_ids_{config["start_epoch"]}_{config["end_epoch"]}_.json'
@@ -4,8 +4,8 @@ import psutil
 
 try:
     print("Testing imports...")
-    from Utils.api import match, match_timeline, handle_api_response
-    from Utils.S3 import send_match_json, pull_s3_object, upload_to_s3, alter_s3_file
+    from Utils.api import fetch_batch, handle_api_response, estimate_batch_seconds
+    from Utils.S3 import MatchBatcher, pull_s3_object, upload_to_s3, alter_s3_file
     from Utils.logger import get_logger
     logger = get_logger(__name__)
     print("✅ All imports successful")
@@ -81,33 +81,38 @@ def run_processor(config, matchlist):
 
     total = 0
     no_data = 0
-    match_data = []
-    timeline_data = []
-    active_threads = []
-    current_index = 0  # Track current position for leftover handling
+    current_index = -1  # Track current position for leftover handling
     
-    # Batch counters for progress tracking
-    match_batch_count = 0
-    timeline_batch_count = 0
+    # Upload every 200 regular matches and every 50 timelines (smaller batch due to larger data size)
+    match_batcher = MatchBatcher(config['BUCKET'], 200, source=config['source'], data_collection_type="match")
+    timeline_batcher = MatchBatcher(config['BUCKET'], 50, source=config['source'], data_collection_type="match_timeline")
 
     try:
         print(f"🔄 DEBUG: Starting main processing loop with {len(uniqueMatches)} matches...")
-        for i, match_id in enumerate(uniqueMatches):
-            current_index = i  # Update current position
+        batch_size = config['FETCH_BATCH_SIZE']
+        # Batches step by batch_size, so track the next threshold rather than batch_start % N
+        next_memory_check = 0
+        next_progress_report = 0
+        last_batch_seconds = 0  # measured duration of the previous fetch_batch
+        for batch_start in range(0, len(uniqueMatches), batch_size):
+            batch_ids = uniqueMatches[batch_start:batch_start + batch_size]
             
             # Memory monitoring every 500 matches (reduced from every 10)
-            if i % 500 == 0:
+            if batch_start >= next_memory_check:
+                next_memory_check = (batch_start // 500 + 1) * 500
                 current_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
-                print(f"🔍 Memory check: {current_memory:.2f} MB (match {i+1}/{len(uniqueMatches)})")
+                print(f"🔍 Memory check: {current_memory:.2f} MB (match {batch_start+1}/{len(uniqueMatches)})")
             
-            # Check API key expiration before processing each match
+            # Stop before a batch that would still be running when the API key expires - requests
+            # sent after expiry come back 401/403 and those matches would be dropped as no_data
             current_time = int(time.time())
-            if current_time >= int(config['API_KEY_EXPIRATION']):
-                print(f"⚠️ API key expired at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(int(config['API_KEY_EXPIRATION'])))}!")
+            batch_estimate = max(estimate_batch_seconds(len(batch_ids)), last_batch_seconds)
+            if current_time + batch_estimate >= int(config['API_KEY_EXPIRATION']):
+                print(f"⚠️ API key expires at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(int(config['API_KEY_EXPIRATION'])))} - not enough time left for the next batch (~{batch_estimate:.0f}s)")
                 print(f"Current time: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(current_time))}")
                 
-                # Get unprocessed matches (from current index onwards)
-                unprocessed_matches = list(uniqueMatches)[i + 1:]
+                # Get unprocessed matches (from the current batch onwards)
+                unprocessed_matches = list(uniqueMatches)[batch_start:]
                 print(f"Saving {len(unprocessed_matches)} unprocessed matches to S3...")
                 
                 # Create data to upload with unprocessed matches and data collection type
@@ -120,58 +125,34 @@ def run_processor(config, matchlist):
                 upload_to_s3(config['BUCKET'], key, data_to_upload)
                 print(f"✅ Unprocessed matches saved to: {key}")
 
-                print(f"🛑 Processing stopped due to API key expiration. Processed {i}/{len(uniqueMatches)} matches.")
+                print(f"🛑 Processing stopped due to API key expiration. Processed {batch_start}/{len(uniqueMatches)} matches.")
                 break
             
             # Progress indicator every 1000 matches
-            if i % 1000 == 0:
-                print(f"  Progress: {i}/{len(uniqueMatches)} matches processed")
-                
-            temp_data_match = match(match_id, config['API_KEY'])
-            temp_data_timeline = match_timeline(match_id, config['API_KEY'])
+            if batch_start >= next_progress_report:
+                next_progress_report = (batch_start // 1000 + 1) * 1000
+                print(f"  Progress: {batch_start}/{len(uniqueMatches)} matches processed")
             
-            if handle_api_response(temp_data_match, func_name='match') is None:
-                no_data += 1
-                continue
-            if handle_api_response(temp_data_timeline, func_name='match_timeline') is None:
-                no_data += 1
-                continue
-
-            temp_data_match['source'] = config['source']
-            temp_data_timeline['source'] = config['source']
-            match_data.append(temp_data_match)
-            timeline_data.append(temp_data_timeline)
-            total += 1
-
-            # Upload every 50 timeline matches (smaller batch due to larger data size)
-            if len(timeline_data) >= 50:
-                timeline_batch_count += 1
-                print(f"📤 Uploading batch #{timeline_batch_count} of {len(timeline_data)} timeline data to S3 (total processed: {total})")
-                
-                thread = send_match_json(data=timeline_data.copy(), bucket=config['BUCKET'], source=config['source'], data_collection_type="match_timeline")
-                if thread:
-                    active_threads.append(thread)
-                
-                timeline_data = []  # Clear memory immediately
-                
-                # Force garbage collection
-                import gc
-                gc.collect()
+            # Fetch match + timeline for the whole batch concurrently
+            batch_started = time.time()
+            results = fetch_batch(batch_ids, config['API_KEY'], config['FETCH_CONCURRENCY'])
+            last_batch_seconds = time.time() - batch_started
             
-            # Upload every 200 regular matches (adjusted batch size)
-            if len(match_data) >= 200:
-                match_batch_count += 1
-                print(f"📤 Uploading batch #{match_batch_count} of {len(match_data)} match data to S3 (total processed: {total})")
+            for offset, (match_id, temp_data_match, temp_data_timeline) in enumerate(results):
+                current_index = batch_start + offset  # Update current position
                 
-                thread = send_match_json(data=match_data.copy(), bucket=config['BUCKET'], source=config['source'], data_collection_type="match")
-                if thread:
-                    active_threads.append(thread)
-                
-                match_data = []  # Clear memory immediately
-                
-                # Force garbage collection
-                import gc
-                gc.collect()
+                if handle_api_response(temp_data_match, func_name='match') is None:
+                    no_data += 1
+                    continue
+                if handle_api_response(temp_data_timeline, func_name='match_timeline') is None:
+                    no_data += 1
+                    continue
+
+                temp_data_match['source'] = config['source']
+                temp_data_timeline['source'] = config['source']
+                match_batcher.add(temp_data_match)
+                timeline_batcher.add(temp_data_timeline)
+                total += 1
 
     except Exception as e:
         print(f"❌ ERROR during match processing: {e}")
@@ -194,51 +175,21 @@ def run_processor(config, matchlist):
         upload_to_s3(config['BUCKET'], key, data_to_upload)
         print(f"✅ Unprocessed matches saved to: {key}")
 
-    print(f"🔍 DEBUG: Main processing loop completed. match_data: {len(match_data)}, timeline_data: {len(timeline_data)}, total: {total}")
-
-    # Upload remaining match data
-    if match_data:
-        match_batch_count += 1
-        print(f"📤 Uploading final batch #{match_batch_count} of {len(match_data)} match data...")
-        thread = send_match_json(data=match_data, bucket=config['BUCKET'], source=config['source'], data_collection_type="match")
-        if thread:
-            active_threads.append(thread)
-        print(f"✅ Final match data batch upload thread created")
-        
-        # Clear match_data after final upload
-        match_data = []
-        import gc
-        gc.collect()
-    else:
-        print(f"ℹ️ No final match data batch to upload (match_data list is empty)")
+    print(f"🔍 DEBUG: Main processing loop completed. match_data: {len(match_batcher.buffer)}, timeline_data: {len(timeline_batcher.buffer)}, total: {total}")
 
-    # Upload remaining timeline data
-    if timeline_data:
-        timeline_batch_count += 1
-        print(f"📤 Uploading final batch #{timeline_batch_count} of {len(timeline_data)} timeline data...")
-        thread = send_match_json(data=timeline_data, bucket=config['BUCKET'], source=config['source'], data_collection_type="match_timeline")
-        if thread:
-            active_threads.append(thread)
-        print(f"✅ Final timeline data batch upload thread created")
-        
-        # Clear timeline_data after final upload
-        timeline_data = []
-        import gc
-        gc.collect()
-    else:
-        print(f"ℹ️ No final timeline data batch to upload (timeline_data list is empty)")
+    # Upload remaining match and timeline data
+    match_batcher.flush()
+    timeline_batcher.flush()
 
     # Wait for all uploads
-    print(f"⏳ Waiting for {len(active_threads)} upload threads to complete...")
-    
-    for i, thread in enumerate(active_threads):
-        thread.join()
-        print(f"✅ Upload thread {i+1}/{len(active_threads)} completed")
+    print(f"⏳ Waiting for {len(match_batcher.futures) + len(timeline_batcher.futures)} uploads to complete...")
+    match_batcher.join()
+    timeline_batcher.join()
 
     print("All uploads completed!")
     print(f"Matches with no data: {no_data}")
-    print(f"Match batches uploaded: {match_batch_count}")
-    print(f"Timeline batches uploaded: {timeline_batch_count}")
+    print(f"Match batches uploaded: {match_batcher.batch_count}")
+    print(f"Timeline batches uploaded: {timeline_batcher.batch_count}")
 
     # Always delete matchlist - it's either fully processed or stored in leftovers
     alter_s3_file(config['BUCKET'], matchlist, 'delete')
@@ -251,6 +202,6 @@ def run_processor(config, matchlist):
     print(f"Runtime: {end_time - start_time:.2f} seconds")
     print(f"Memory usage: {start_memory:.1f}MB -> {end_memory:.1f}MB")
     print(f"Total matches processed: {total}")
-    print(f"Upload batches: {len(active_threads)}")
-    print(f"Batch breakdown: {match_batch_count} match batches, {timeline_batch_count} timeline batches")
+    print(f"Upload batches: {match_batcher.batch_count + timeline_batcher.batch_count}")
+    print(f"Batch breakdown: {match_batcher.batch_count} match batches, {timeline_batcher.batch_count} timeline batches")
     return
\ No newline at end of file
@@ -1,16 +1,17 @@
 import json
-import boto3
+import orjson
 import sys
 import time
 import urllib.parse
+from concurrent.futures import wait
 
 # Test imports immediately and catch any import errors
 try:
     print("Testing imports...")
     import mysql.connector
-    from Utils.sql import insert_data_to_mysql, ensure_healthy_connection, format_error_response
+    from Utils.sql import insert_data_to_mysql, ensure_healthy_connection, format_error_response, get_pooled_connection
     from Utils.json import flatten_json, flatten_perks, flatten_participant_frames
-    from Utils.S3 import get_parameter_from_ssm, send_timeline_events_json
+    from Utils.S3 import get_parameter_from_ssm, send_timeline_events_json, read_s3_object, s3_client
     from Utils.logger import get_logger
     print("✅ All imports successful")
 except ImportError as e:
@@ -72,17 +73,16 @@ def lambda_handler(event, context):
             request_id=context.aws_request_id
         )
 
-    s3_client = boto3.client('s3')
-    
     # Initialize these variables so they exist for the finally block
     cursor = None
     conn = None
 
     try:
         logger.info("📥 Downloading and parsing S3 file...")
-        s3_object = s3_client.get_object(Bucket=bucket, Key=decoded_fileKey)
-        file_content = s3_object['Body'].read()
-        data = json.loads(file_content.decode('utf-8'))
+        # Match batches are uploaded gzipped (ContentEncoding) - read_s3_object inflates those
+        file_content = read_s3_object(bucket, decoded_fileKey)
+        data = orjson.loads(file_content)
+        file_content = None  # Only the parsed objects are needed from here on
         logger.info(f"✅ S3 file loaded successfully")
         print(f"{decoded_fileKey} being processed")
         
@@ -118,8 +118,10 @@ def lambda_handler(event, context):
             logger.info(f"📋 Processing {len(data['matches'])} matches...")
 
             games_processed = 0
+            timeline_uploads = []  # Futures from the shared upload pool
+            data['matches'].reverse()  # pop() from the end is O(1); reversing keeps file order
             while data['matches']:
-                game = data['matches'].pop(0)
+                game = data['matches'].pop()
                 games_processed += 1
                 events = []
                 participant_frames = []
@@ -166,7 +168,7 @@ def lambda_handler(event, context):
                     timeline_bucket = bucket  # Use the same bucket as the source file
                     
                     # Upload events with date-based folder structure
-                    upload_thread = send_timeline_events_json(
+                    upload_future = send_timeline_events_json(
                         events_data=events,
                         match_id=match_id,
                         bucket=timeline_bucket,
@@ -174,7 +176,8 @@ def lambda_handler(event, context):
                         source=None  # Set to 'test' if you want test prefix
                     )
                     
-                    if upload_thread:
+                    if upload_future:
+                        timeline_uploads.append(upload_future)
                         logger.info(f"📤 Queued timeline events upload for match {match_id}")
                         print(f"📤 Queued timeline events upload for match {match_id}")
                     else:
@@ -195,6 +198,12 @@ def lambda_handler(event, context):
                     print(f"Games remaining: {len(data['matches'])}, Participant frames processed: {len(all_data)}")
                     print("---")
             
+            # Uploads run in the background - make sure they land before the invocation is frozen
+            done, _ = wait(timeline_uploads)
+            failed_uploads = sum(1 for future in done if future.exception())
+            if failed_uploads:
+                logger.warning(f"⚠️ {failed_uploads}/{len(timeline_uploads)} timeline events uploads failed")
+            
             # Final summary for timeline processing
             print(f"Timeline processing complete: {games_processed} games processed")
             print(f"Total participant frames: {len(all_data)}")
@@ -218,43 +227,41 @@ def lambda_handler(event, context):
             print(f"Initial memory usage: {initial_memory:.2f} MB")
             
             games_processed = 0
+            data['matches'].reverse()  # pop() from the end is O(1); reversing keeps file order
             while data['matches']:  # While there are games left
-                game = data['matches'].pop(0)  # Remove first game
+                game = data['matches'].pop()  # Remove next game
                 games_processed += 1
+
+                # Game-level columns are the same for every player - build them once per game
+                game_fields = {
+                    'dataVersion': game['metadata']['dataVersion'],
+                    'matchId': game['metadata']['matchId'],
+                    'gameCreation': game['info']['gameCreation'],
+                    'gameDuration': game['info']['gameDuration'],
+                    'gameVersion': game['info']['gameVersion'],
+                    'mapId': game['info']['mapId']
+                }
+                # Add source from game data
+                if 'source' in game:
+                    game_fields['source'] = game['source']
                 
                 # Process all players in this game
-                for player_idx, player in enumerate(game['info']['participants']):
-                    # Create a copy to avoid modifying the original
-                    player_copy = player.copy()
-                    
-                    perks = flatten_perks(player_copy['perks'])
-                    del player_copy['perks']
-                    temp_player = flatten_json(player_copy)
+                for player in game['info']['participants']:
+                    # The game is dropped after this loop, so the player dict can be consumed in place
+                    perks = flatten_perks(player.pop('perks'))
+                    temp_player = flatten_json(player)
                     temp_player.update(perks)
 
                     #remove challenges_ and missions_ from keys
                     cleaned_player = {}
                     for key, value in temp_player.items():
                         if key.startswith("challenges_"):
-                            new_key = key.replace("challenges_", "", 1)
+                            key = key[11:]
                         elif key.startswith("missions_"):
-                            new_key = key.replace("missions_", "", 1)
-                        else:
-                            new_key = key
-                        cleaned_player[new_key] = value
+                            key = key[9:]
+                        cleaned_player[key] = value
 
-                    cleaned_player['dataVersion'] = game['metadata']['dataVersion']
-                    cleaned_player['matchId'] = game['metadata']['matchId']
-
-                    cleaned_player['gameCreation'] = game['info']['gameCreation']
-                    cleaned_player['gameDuration'] = game['info']['gameDuration']
-                    cleaned_player['gameVersion'] = game['info']['gameVersion']
-                    cleaned_player['mapId'] = game['info']['mapId']
-                    
-                    # Add source from game data
-                    if 'source' in game:
-                        cleaned_player['source'] = game['source']
-                    
+                    cleaned_player.update(game_fields)
                     all_data.append(cleaned_player)
                 
                 # Game is now completely processed, clear it from memory
@@ -288,7 +295,8 @@ def lambda_handler(event, context):
         print("About to connect to database...")
         logger.info("🔌 Attempting to connect to MySQL database...")
         try:
-            conn = mysql.connector.connect(
+            # Pooled - reused across warm invocations, and conn.close() hands it back
+            conn = get_pooled_connection(
                 host=DB_HOST,
                 user=DB_USER,
                 password=DB_PASSWORD,
@@ -446,11 +454,14 @@ def lambda_handler(event, context):
         )
     
     finally:
-        # Ensuring resources are closed
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
+        # Ensuring resources are closed - conn.close() must run even if the cursor close fails,
+        # or the pool's only connection is never returned and warm invocations hit PoolError
+        try:
+            if cursor:
+                cursor.close()
+        finally:
+            if conn:
+                conn.close()
 
     # Final success summary
     execution_time = time.time() - transaction_state.get('start_time', time.time())
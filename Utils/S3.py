@@ -1,9 +1,14 @@
 import time
 import boto3
-import json
-import threading
-from botocore.exceptions import NoCredentialsError, PartialCredentialsError, ClientError
+import orjson
+import gzip
+import gc
+import io
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from botocore.config import Config
+from boto3.s3.transfer import TransferConfig
 import logging
+from Utils.logger import configure_root_logging
 from datetime import datetime, timezone
 import os
 
@@ -13,7 +18,31 @@ if os.environ.get("DEBUG_AWS_CREDS", "false").lower() == "true":
     print("AWS credential debugging enabled")
 
 # Configure logging
-logging.basicConfig(level=logging.INFO, filename='api_errors.log')
+configure_root_logging(logging.INFO)
+
+# One client per process: boto3 clients are thread-safe, and building one per call
+# reloads botocore models and throws away the pooled HTTPS connections
+s3_client = boto3.client(
+    's3',
+    region_name=os.environ.get('AWS_REGION', 'us-east-2'),
+    # Sized for upload_pool workers plus the parallel parts of multipart uploads and ranged GETs
+    config=Config(max_pool_connections=50, tcp_keepalive=True, retries={'max_attempts': 3, 'mode': 'adaptive'})
+)
+
+# SSM lookups run several times per Lambda invocation - reuse one client like s3_client
+ssm_client = boto3.client('ssm', region_name=os.environ.get('AWS_REGION', 'us-east-2'))
+
+# Bodies past the threshold go up as parallel 8 MB parts instead of one long PUT
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+transfer_config = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=MULTIPART_THRESHOLD,
+    max_concurrency=10,
+    use_threads=True
+)
+
+# Bounded pool for background uploads - callers get a Future back instead of a raw thread
+upload_pool = ThreadPoolExecutor(max_workers=8)
 
 def test_aws_credentials():
     """Test if AWS credentials are properly configured and accessible."""
@@ -38,14 +67,25 @@ def test_aws_credentials():
         print(f"AWS credential test failed: {str(e)}")
         return False
 
-def upload_to_s3(bucket, key, data):
-    """Enhanced upload function with better logging"""
+def upload_to_s3(bucket, key, data, compress=False):
+    """
+    Enhanced upload function with better logging
+
+    compress=True gzips the body and sets ContentEncoding='gzip'; readers in this
+    package (pull_s3_object, the Lambda) decompress based on that header
+    """
     try:
-        data = json.dumps(data)
-        region = os.environ.get('AWS_REGION', 'us-east-2')
-        s3 = boto3.client('s3', region_name=region)
+        body = orjson.dumps(data)
+        extra_args = {}
+        if compress:
+            body = gzip.compress(body, compresslevel=4)
+            extra_args['ContentEncoding'] = 'gzip'
         
-        s3.put_object(Bucket=bucket, Key=key, Body=data)
+        if len(body) > MULTIPART_THRESHOLD:
+            extra_args['ContentType'] = 'application/json'
+            s3_client.upload_fileobj(io.BytesIO(body), bucket, key, ExtraArgs=extra_args, Config=transfer_config)
+        else:
+            s3_client.put_object(Bucket=bucket, Key=key, Body=body, ContentType='application/json', **extra_args)
         print(f"✓ Successfully uploaded: {key}")
         
     except Exception as e:
@@ -69,7 +109,7 @@ def send_match_json(data, bucket, custom_date=None, source=None, data_collection
         return None
         
     # Create a deep copy to avoid shared state
-    data_copy = json.loads(json.dumps(data))
+    data_copy = orjson.loads(orjson.dumps(data))
     
     # Get date for folder structure
     if custom_date:
@@ -122,15 +162,74 @@ def send_match_json(data, bucket, custom_date=None, source=None, data_collection
         'matches': data_copy
     }
     
-    # Start upload on new thread (upload_to_s3 will handle json.dumps)
-    upload_thread = threading.Thread(
-        target=upload_to_s3, 
-        args=(bucket, s3_key, enhanced_data)
-    )
-    upload_thread.start()
+    # Queue upload on the shared pool (upload_to_s3 will handle serialization). Match batches stay
+    # plain JSON: the keys end in .json and readers pick decompression from the extension
+    upload_future = upload_pool.submit(upload_to_s3, bucket, s3_key, enhanced_data)
 
     print(f"Queued upload: {match_count} matches -> {s3_key}")
-    return upload_thread
+    return upload_future
+
+class MatchBatcher:
+    """
+    Buffer match payloads and upload them to S3 in fixed-size batches
+
+    Args:
+        bucket: S3 bucket name
+        batch_size: Number of matches per uploaded object
+        source: Passed through to send_match_json
+        data_collection_type: Passed through to send_match_json ('match' or 'match_timeline')
+        max_pending: Uploads allowed in flight before flush() waits for one to finish
+    """
+    def __init__(self, bucket, batch_size, source=None, data_collection_type=None, max_pending=2):
+        self.bucket = bucket
+        self.batch_size = batch_size
+        self.source = source
+        self.data_collection_type = data_collection_type
+        self.max_pending = max_pending
+        self.buffer = []
+        self.futures = []
+        self.batch_count = 0
+
+    def add(self, data):
+        """Buffer one match, uploading the batch once it is full"""
+        self.buffer.append(data)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Upload whatever is buffered; returns the upload Future or None"""
+        if not self.buffer:
+            return None
+
+        # upload_pool's queue is unbounded - if S3 stalls, hold the fetch loop here instead of
+        # stacking up serialized batches in memory
+        pending = [future for future in self.futures if not future.done()]
+        if len(pending) >= self.max_pending:
+            print(f"⏳ {len(pending)} {self.data_collection_type} uploads still in flight - waiting for one to finish")
+            wait(pending, return_when=FIRST_COMPLETED)
+
+        self.batch_count += 1
+        print(f"📤 Uploading batch #{self.batch_count} of {len(self.buffer)} {self.data_collection_type} data to S3")
+
+        # Hand the buffer off to the upload pool and start a fresh one
+        future = send_match_json(data=self.buffer, bucket=self.bucket, source=self.source, data_collection_type=self.data_collection_type)
+        if future:
+            self.futures.append(future)
+        self.buffer = []
+
+        # Force garbage collection
+        gc.collect()
+        return future
+
+    def join(self):
+        """Wait for every upload started by this batcher"""
+        for i, future in enumerate(self.futures):
+            # upload_to_s3 already logged the traceback - report it and keep waiting on the rest
+            error = future.exception()
+            if error:
+                print(f"❌ {self.data_collection_type} upload {i+1}/{len(self.futures)} failed: {error}")
+            else:
+                print(f"✅ {self.data_collection_type} upload {i+1}/{len(self.futures)} completed")
 
 def send_timeline_events_json(events_data, match_id, bucket, real_timestamp, source=None):
     """
@@ -147,7 +246,7 @@ def send_timeline_events_json(events_data, match_id, bucket, real_timestamp, sou
         return None
         
     # Create a deep copy to avoid shared state
-    events_copy = json.loads(json.dumps(events_data))
+    events_copy = orjson.loads(orjson.dumps(events_data))
     
     # Convert real_timestamp to datetime for folder structure
     try:
@@ -189,9 +288,9 @@ def send_timeline_events_json(events_data, match_id, bucket, real_timestamp, sou
     
     # Create the S3 key with timeline-events folder structure
     if source == 'test':
-        s3_key = f"timeline-events/year={year}/month={month}/day={day}/test_{match_id}_events.json"
+        s3_key = f"timeline-events/year={year}/month={month}/day={day}/test_{match_id}_events.json.gz"
     else:
-        s3_key = f"timeline-events/year={year}/month={month}/day={day}/{match_id}_events.json"
+        s3_key = f"timeline-events/year={year}/month={month}/day={day}/{match_id}_events.json.gz"
 
     # Enhance the JSON with metadata
     enhanced_data = {
@@ -206,15 +305,11 @@ def send_timeline_events_json(events_data, match_id, bucket, real_timestamp, sou
         'events': events_copy
     }
     
-    # Start upload on new thread (upload_to_s3 will handle json.dumps)
-    upload_thread = threading.Thread(
-        target=upload_to_s3, 
-        args=(bucket, s3_key, enhanced_data)
-    )
-    upload_thread.start()
+    # Queue upload on the shared pool (upload_to_s3 will handle serialization + gzip)
+    upload_future = upload_pool.submit(upload_to_s3, bucket, s3_key, enhanced_data, True)
 
     print(f"Queued timeline events upload: {len(events_copy)} events for match {match_id} -> {s3_key}")
-    return upload_thread
+    return upload_future
 
 def get_parameter_from_ssm(parameter_name):
     """
@@ -223,13 +318,7 @@ def get_parameter_from_ssm(parameter_name):
     :param parameter_name: The name of the parameter stored in SSM.
     :return: The parameter value if successful, or None if there's an error.
     """
-    # Initialize the boto3 SSM client with enhanced configuration
-    region = os.environ.get("AWS_REGION", "us-east-2")
-    
     try:
-        # Create SSM client with explicit configuration
-        ssm_client = boto3.client('ssm', region_name=region)
-        
         # Fetch the parameter from SSM
         response = ssm_client.get_parameter(
             Name=parameter_name,
@@ -241,6 +330,28 @@ def get_parameter_from_ssm(parameter_name):
         print(f"Error retrieving parameter: {str(e)}")
         return None
 
+def read_s3_object(bucket, key):
+    """
+    Download an S3 object's bytes, gunzipped if it was uploaded with ContentEncoding='gzip'
+
+    Objects past MULTIPART_THRESHOLD are fetched as parallel ranged GETs using the
+    same part size as uploads. The first GET still raises NoSuchKey for missing keys.
+    """
+    response = s3_client.get_object(Bucket=bucket, Key=key)
+    stream = response['Body']
+    if response['ContentLength'] > MULTIPART_THRESHOLD:
+        # Large object: drop the single stream and pull the parts concurrently instead
+        stream.close()
+        stream = io.BytesIO()
+        s3_client.download_fileobj(bucket, key, stream, Config=transfer_config)
+        stream.seek(0)
+
+    if response.get('ContentEncoding') == 'gzip':
+        # Inflate straight off the stream so the compressed copy is never held twice
+        with gzip.GzipFile(fileobj=stream) as body:
+            return body.read()
+    return stream.read()
+
 def pull_s3_object(bucket, filepath):
     """
     Download and return JSON data from S3 object
@@ -253,12 +364,7 @@ def pull_s3_object(bucket, filepath):
         dict: Parsed JSON data from S3 object, or None if error
     """
     try:
-        region = os.environ.get('AWS_REGION', 'us-east-2')
-        s3 = boto3.client('s3', region_name=region)
-        
-        response = s3.get_object(Bucket=bucket, Key=filepath)
-        file_content = response['Body'].read().decode('utf-8')
-        data = json.loads(file_content)
+        data = orjson.loads(read_s3_object(bucket, filepath))
         
         print(f"✓ Successfully downloaded: {filepath}")
         return data
@@ -281,24 +387,21 @@ def alter_s3_file(bucket, key, operation, data=None):
         bool: True if successful, False if error
     """
     try:
-        region = os.environ.get('AWS_REGION', 'us-east-2')
-        s3 = boto3.client('s3', region_name=region)
-        
         if operation == "overwrite":
             if data is None:
                 print(f"✗ Error: data is required for overwrite operation")
                 return False
             
             # Convert data to JSON if it's not already a string
-            if not isinstance(data, str):
-                data = json.dumps(data)
+            if not isinstance(data, (str, bytes)):
+                data = orjson.dumps(data)
             
-            s3.put_object(Bucket=bucket, Key=key, Body=data)
+            s3_client.put_object(Bucket=bucket, Key=key, Body=data)
             print(f"✓ Successfully overwritten: {key}")
             return True
             
         elif operation == "delete":
-            s3.delete_object(Bucket=bucket, Key=key)
+            s3_client.delete_object(Bucket=bucket, Key=key)
             print(f"✓ Successfully deleted: {key}")
             return True
             
@@ -322,20 +425,20 @@ def check_files(bucket, filepath):
         list: List of object keys found at the path, or empty list if none found
     """
     try:
-        region = os.environ.get('AWS_REGION', 'us-east-2')
-        s3 = boto3.client('s3', region_name=region)
-        
-        response = s3.list_objects_v2(Bucket=bucket, Prefix=filepath)
-        
-        if 'Contents' in response:
-            # Filter out folders (objects that end with /) and the folder itself
-            keys = [obj['Key'] for obj in response['Contents'] 
-                   if not obj['Key'].endswith('/') and obj['Key'] != filepath.rstrip('/')]
+        # A single list_objects_v2 call stops at 1000 keys - page through all of them
+        paginator = s3_client.get_paginator('list_objects_v2')
+        folder = filepath.rstrip('/')
+
+        # Filter out folders (objects that end with /) and the folder itself
+        keys = [obj['Key'] for page in paginator.paginate(Bucket=bucket, Prefix=filepath)
+               for obj in page.get('Contents', [])
+               if not obj['Key'].endswith('/') and obj['Key'] != folder]
+
+        if keys:
             print(f"✓ Found {len(keys)} files at {filepath}")
-            return keys
         else:
             print(f"✓ No files found at {filepath}")
-            return []
+        return keys
             
     except Exception as e:
         print(f"✗ Error checking files at {filepath}: {str(e)}")
@@ -344,8 +447,8 @@ def check_files(bucket, filepath):
 ###SAVING JSON LOCALLY TO TEST LAMBDA ETL
 def save_json(data):
     file_path = os.path.join(os.getcwd(), f'match_json_objects_{int(time.time())}.json') 
-    with open(file_path, 'w') as json_file:
-        json.dump(data, json_file)
+    with open(file_path, 'wb') as json_file:
+        json_file.write(orjson.dumps(data))
     print('complete')
 
 # Test AWS credentials when this module is imported
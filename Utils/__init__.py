@@ -1,5 +1,2 @@
-# Import modules explicitly to avoid circular imports
-from . import api
-from . import sql
-from . import json
-from . import S3
\ No newline at end of file
+# Submodules are imported on demand (from Utils.api import ...) so that each entry point
+# only pays for what it uses - e.g. the Lambda never loads requests, EC2 never loads mysql
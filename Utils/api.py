@@ -1,18 +1,71 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 import logging 
+from Utils.logger import configure_root_logging
 import time
 import random
-from typing import Dict, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
 
-logging.basicConfig(level=logging.INFO, filename='api_errors.log')
+configure_root_logging(logging.INFO)
+
+class TokenBucket:
+    """
+    Token bucket refilling `capacity` tokens every `window` seconds
+    Tokens may go negative: a caller that overdraws reserves its slot and is
+    told how long to wait, so concurrent callers queue up instead of racing
+    """
+    __slots__ = ('capacity', 'rate', 'tokens', 'last')
+
+    def __init__(self, capacity: int, window: float):
+        self.capacity = capacity
+        self.rate = capacity / window
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+
+    def acquire(self, cost: float = 1) -> float:
+        """Take `cost` tokens and return the seconds to wait before using them"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        self.tokens -= cost
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
 
 class RateLimitHandler:
     def __init__(self):
         self.request_times = []
         self.personal_rate_limit_reset = 0
         self.service_rate_limit_reset = 0
+        # Client-side quota so we wait before Riot has to answer with a 429
+        self.buckets = (
+            TokenBucket(20, 1),     # burst: 20 requests per second
+            TokenBucket(100, 120),  # personal: 100 requests per 2 minutes
+            TokenBucket(500, 600),  # method: 500 requests per 10 minutes
+        )
+        self.blocked_until = 0.0  # set from Retry-After so every worker backs off, not just the one that got the 429
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Reserve one request in every bucket
+        Returns wait time in seconds before the request may be sent
+        """
+        with self.lock:
+            wait_time = max(bucket.acquire() for bucket in self.buckets)
+            return max(wait_time, self.blocked_until - time.monotonic())
+
+    def pause(self, seconds: float):
+        """Hold all requests for `seconds` from now"""
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
     
-    def handle_rate_limit_response(self, response: requests.Response) -> int:
+    def handle_rate_limit_response(self, response: requests.Response, attempt: int = 0) -> float:
         """
         Handle rate limit response and return appropriate wait time
         Returns wait time in seconds
@@ -20,9 +73,14 @@ class RateLimitHandler:
         # Check for Retry-After header (most reliable)
         retry_after = response.headers.get('Retry-After')
         if retry_after:
-            wait_time = int(retry_after)
-            logging.info(f"Rate limited - Retry-After header indicates {wait_time}s wait")
-            return wait_time
+            try:
+                wait_time = float(retry_after)
+            except ValueError:
+                wait_time = None
+            if wait_time is not None:
+                logging.info(f"Rate limited - Retry-After header indicates {wait_time}s wait")
+                self.pause(wait_time)
+                return wait_time
         
         # Check for X-Rate-Limit headers (common pattern)
         rate_limit_type = response.headers.get('X-Rate-Limit-Type', 'unknown')
@@ -37,9 +95,9 @@ class RateLimitHandler:
                 wait_time = 30  # More conservative for service limits
                 logging.info(f"Service rate limit hit - waiting {wait_time}s")
             else:
-                # Unknown rate limit type - be conservative
-                wait_time = 10
-                logging.info(f"Unknown rate limit type - waiting {wait_time}s")
+                # Unknown rate limit type - back off and let the buckets catch up
+                wait_time = self.exponential_backoff(attempt)
+                logging.info(f"Unknown rate limit type - waiting {wait_time:.1f}s")
         else:
             # Server error (500+) - exponential backoff
             wait_time = min(60, 2 ** (3 - 1))  # Cap at 60 seconds
@@ -58,27 +116,57 @@ class RateLimitHandler:
 
 rate_limiter = RateLimitHandler()
 
-def make_api_request_with_smart_backoff(url: str, max_retries: int = 3) -> Optional[Dict]:
+# Shared keep-alive session: one TLS connection per host is reused across calls and
+# fetch_batch workers instead of a fresh handshake per request.
+# urllib3 only retries failed connects (DNS/TCP blips) - status codes and read errors come
+# back to make_api_request_with_smart_backoff, which coordinates them with the limiter and breaker
+connect_retry = Retry(total=2, connect=2, read=0, redirect=0, status=0, backoff_factor=0.5)
+session = requests.Session()
+session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=connect_retry))
+
+class CircuitOpenError(Exception):
+    """Request was never sent because the circuit breaker is open - safe to retry after recovery"""
+
+def make_api_request_with_smart_backoff(url: str, max_retries: int = 3, params: Optional[Dict] = None) -> Optional[Dict]:
     """
     Make API request with intelligent retry logic
+    Raises CircuitOpenError instead of returning None when the breaker short-circuits,
+    so callers can tell "skipped" apart from "failed"
     """
     for attempt in range(max_retries):
+        # Riot is failing repeatedly - don't queue more retries behind it.
+        # Only a fresh request claims a slot (the half-open probe); a request already
+        # in flight keeps retrying unless the breaker has tripped open meanwhile
+        if attempt == 0 and not circuit_breaker.can_execute():
+            raise CircuitOpenError(url)
+        if attempt > 0 and circuit_breaker.is_open():
+            raise CircuitOpenError(url)
+
+        # Pre-emptive rate limiting - wait for quota instead of burning a 429
+        wait_time = rate_limiter.acquire()
+        if wait_time:
+            logging.info(f"Rate limit quota exhausted - waiting {wait_time:.1f}s")
+            time.sleep(wait_time)
+
         try:
-            response = requests.get(url)
+            response = session.get(url, params=params, timeout=10)
             
             # Success case
             if response.status_code == 200:
-                return response.json()
+                data = orjson.loads(response.content)
+                circuit_breaker.on_success()
+                return data
             
             # Rate limit or server error
             elif response.status_code >= 429:
                 if attempt == max_retries - 1:
                     logging.error(f"Max retries exceeded for {url}")
+                    circuit_breaker.on_failure()
                     return None
                 
                 # Smart wait time calculation
                 if response.status_code == 429:
-                    wait_time = rate_limiter.handle_rate_limit_response(response)
+                    wait_time = rate_limiter.handle_rate_limit_response(response, attempt)
                 else:
                     wait_time = rate_limiter.exponential_backoff(attempt)
                 
@@ -86,85 +174,177 @@ def make_api_request_with_smart_backoff(url: str, max_retries: int = 3) -> Optio
                 time.sleep(wait_time)
                 continue
             
-            # Client errors (400-428) - don't retry
+            # Client errors (400-428) - don't retry. Riot did answer, so this still
+            # settles a half-open probe
             elif 400 <= response.status_code < 429:
                 logging.error(f"Client error {response.status_code} for {url}: {response.text}")
+                circuit_breaker.on_success()
                 return None
                 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             if attempt == max_retries - 1:
                 logging.error(f"Request failed after {max_retries} attempts: {e}")
+                circuit_breaker.on_failure()
                 return None
             
             wait_time = rate_limiter.exponential_backoff(attempt)
             logging.info(f"Request exception, waiting {wait_time:.1f}s: {e}")
             time.sleep(wait_time)
     
+    circuit_breaker.on_success()  # unexpected non-error status - Riot answered
     return None
 
+def call_when_breaker_allows(func, *args):
+    """
+    Call an API wrapper, waiting out an open circuit breaker and retrying
+    whenever the request was short-circuited rather than sent
+    """
+    while True:
+        try:
+            return func(*args)
+        except CircuitOpenError:
+            circuit_breaker.wait_until_ready()
+
+# Riot endpoint templates - path parameters are percent-encoded before formatting
+NA1 = 'https://na1.api.riotgames.com'
+AMERICAS = 'https://americas.api.riotgames.com'
+HIGH_ELO_URL = NA1 + '/lol/league/v4/{rank}leagues/by-queue/RANKED_SOLO_5x5'
+LOW_ELO_URL = NA1 + '/lol/league/v4/entries/RANKED_SOLO_5x5/{rank}/{division}'
+MATCH_LIST_URL = AMERICAS + '/lol/match/v5/matches/by-puuid/{puuid}/ids'
+MATCH_URL = AMERICAS + '/lol/match/v5/matches/{match_id}'
+MATCH_TIMELINE_URL = AMERICAS + '/lol/match/v5/matches/{match_id}/timeline'
+CHAMPION_MASTERY_URL = NA1 + '/lol/champion-mastery/v4/champion-masteries/by-puuid/{puuid}/by-champion/{championid}'
+SUMMONER_URL = NA1 + '/lol/summoner/v4/summoners/by-puuid/{puuid}'
+
 # Updated functions using smart backoff
 def highElo(rank: str, key: str, retries: int = 3) -> Optional[Dict]:
     """Enhanced highElo with smart rate limiting"""
-    url = f'https://na1.api.riotgames.com/lol/league/v4/{rank}leagues/by-queue/RANKED_SOLO_5x5?api_key={key}'
-    return make_api_request_with_smart_backoff(url, retries)
+    url = HIGH_ELO_URL.format(rank=quote(rank, safe=''))
+    return make_api_request_with_smart_backoff(url, retries, params={'api_key': key})
 
 def LowElo(rank: str, division: str, page: int, key: str, retries: int = 3) -> Optional[Dict]:
     """Enhanced highElo with smart rate limiting"""
-    url = f'https://na1.api.riotgames.com/lol/league/v4/entries/RANKED_SOLO_5x5/{rank}/{division}?page={page}&api_key={key}'
-    return make_api_request_with_smart_backoff(url, retries)
+    url = LOW_ELO_URL.format(rank=quote(rank, safe=''), division=quote(division, safe=''))
+    return make_api_request_with_smart_backoff(url, retries, params={'page': page, 'api_key': key})
 
 def matchList(puuid: str, key: str, start_epoch: int, end_epoch: int, retries: int = 3) -> Optional[Dict]:
     """Enhanced matchList with smart rate limiting"""
-    url = f'https://americas.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids?startTime={start_epoch}&endTime={end_epoch}&queue=420&type=ranked&start=0&count=100&api_key={key}'
-    return make_api_request_with_smart_backoff(url, retries)
+    url = MATCH_LIST_URL.format(puuid=quote(puuid, safe=''))
+    params = {
+        'startTime': start_epoch,
+        'endTime': end_epoch,
+        'queue': 420,
+        'type': 'ranked',
+        'start': 0,
+        'count': 100,
+        'api_key': key
+    }
+    return make_api_request_with_smart_backoff(url, retries, params=params)
 
 def match(match_id: str, key: str, retries: int = 3) -> Optional[Dict]:
     """Enhanced match with smart rate limiting"""
-    url = f'https://americas.api.riotgames.com/lol/match/v5/matches/{match_id}?api_key={key}'
-    return make_api_request_with_smart_backoff(url, retries)
+    url = MATCH_URL.format(match_id=quote(match_id, safe=''))
+    return make_api_request_with_smart_backoff(url, retries, params={'api_key': key})
 
 def match_timeline(match_id: str, key: str, retries: int = 3) -> Optional[Dict]:
     """Enhanced match with smart rate limiting"""
-    url = f'https://americas.api.riotgames.com/lol/match/v5/matches/{match_id}/timeline?api_key={key}'
-    return make_api_request_with_smart_backoff(url, retries)
+    url = MATCH_TIMELINE_URL.format(match_id=quote(match_id, safe=''))
+    return make_api_request_with_smart_backoff(url, retries, params={'api_key': key})
+
+def _worker_count(concurrency: int) -> int:
+    """Cap pool size at the tightest bucket - extra workers would only sleep in acquire()"""
+    return max(1, min(concurrency, min(bucket.capacity for bucket in rate_limiter.buckets)))
+
+def fetch_batch(match_ids: List[str], key: str, concurrency: int = 20) -> List[Tuple[str, Optional[Dict], Optional[Dict]]]:
+    """
+    Fetch match and timeline data for a batch of match ids concurrently
+    Returns (match_id, match_data, timeline_data) tuples in input order, with
+    None for any request that failed (same contract as the single fetchers)
+    Requests short-circuited by the breaker are held and retried after recovery,
+    never reported as None
+    """
+    with ThreadPoolExecutor(max_workers=_worker_count(concurrency)) as executor:
+        match_futures = [executor.submit(call_when_breaker_allows, match, match_id, key) for match_id in match_ids]
+        timeline_futures = [executor.submit(call_when_breaker_allows, match_timeline, match_id, key) for match_id in match_ids]
+        return [
+            (match_id, match_future.result(), timeline_future.result())
+            for match_id, match_future, timeline_future in zip(match_ids, match_futures, timeline_futures)
+        ]
+
+def estimate_batch_seconds(match_count: int) -> float:
+    """
+    Worst-case seconds fetch_batch needs for match_count matches (a match and a
+    timeline request each) at the tightest sustained rate limit
+    """
+    return 2 * match_count / min(bucket.rate for bucket in rate_limiter.buckets)
+
+def fetch_match_lists(puuids: List[str], key: str, start_epoch, end_epoch, concurrency: int = 20):
+    """
+    Fetch ranked match id lists for many players concurrently
+    Yields (puuid, match_ids) in input order as results arrive, with None for failed requests
+    """
+    with ThreadPoolExecutor(max_workers=_worker_count(concurrency)) as executor:
+        results = executor.map(
+            lambda puuid: call_when_breaker_allows(matchList, puuid, key, start_epoch, end_epoch), puuids
+        )
+        yield from zip(puuids, results)
 
 # Example with even more advanced features
+class SlidingWindow:
+    """
+    Sliding-window counter: the previous window's count is weighted by how much
+    of it still overlaps the sliding window, giving O(1) time and memory
+    """
+    __slots__ = ('limit', 'window', 'cur', 'prev', 'cur_start')
+
+    def __init__(self, limit: int, window: int):
+        self.limit = limit
+        self.window = window
+        self.cur = 0
+        self.prev = 0
+        self.cur_start = 0
+
+    def _roll(self, now: float):
+        """Advance to the window containing `now`"""
+        win_idx = int(now // self.window)
+        if win_idx != self.cur_start:
+            self.prev = self.cur if win_idx == self.cur_start + 1 else 0
+            self.cur = 0
+            self.cur_start = win_idx
+
+    def estimate(self, now: float) -> float:
+        """Approximate number of requests in the trailing window"""
+        self._roll(now)
+        weight = 1 - (now % self.window) / self.window
+        return self.prev * weight + self.cur
+
+    def record(self, now: float):
+        self._roll(now)
+        self.cur += 1
+
 class AdvancedRateLimiter:
     def __init__(self):
-        self.request_history = []
         self.rate_limits = {
-            'personal': {'requests': 100, 'window': 120},  # 100 requests per 2 minutes
-            'method': {'requests': 500, 'window': 600}     # 500 requests per 10 minutes
+            'personal': SlidingWindow(100, 120),  # 100 requests per 2 minutes
+            'method': SlidingWindow(500, 600)     # 500 requests per 10 minutes
         }
     
     def can_make_request(self) -> bool:
         """Check if we can make a request without hitting rate limits"""
         current_time = time.time()
         
-        # Clean old requests from history
-        self.request_history = [
-            req_time for req_time in self.request_history 
-            if current_time - req_time < 600  # Keep 10 minutes of history
-        ]
-        
-        # Check against rate limits
-        for limit_type, config in self.rate_limits.items():
-            recent_requests = [
-                req_time for req_time in self.request_history
-                if current_time - req_time < config['window']
-            ]
-            
-            if len(recent_requests) >= config['requests']:
-                oldest_request = min(recent_requests)
-                wait_time = config['window'] - (current_time - oldest_request)
-                logging.info(f"Pre-emptive rate limit prevention: waiting {wait_time:.1f}s")
+        for limit_type, window in self.rate_limits.items():
+            if window.estimate(current_time) >= window.limit:
+                logging.info(f"Pre-emptive rate limit prevention: {limit_type} limit reached")
                 return False
         
         return True
     
     def record_request(self):
         """Record that a request was made"""
-        self.request_history.append(time.time())
+        current_time = time.time()
+        for window in self.rate_limits.values():
+            window.record(current_time)
 
 # Circuit breaker pattern for handling repeated failures
 class CircuitBreaker:
@@ -174,29 +354,67 @@ class CircuitBreaker:
         self.failure_count = 0
         self.last_failure_time = None
         self.state = 'CLOSED'  # CLOSED, OPEN, HALF_OPEN
+        self.probe_started = None  # set while the single HALF_OPEN probe is in flight
+        self.lock = threading.Lock()  # fetch_batch workers share one breaker
     
     def can_execute(self) -> bool:
-        if self.state == 'CLOSED':
-            return True
-        elif self.state == 'OPEN':
-            if time.time() - self.last_failure_time > self.recovery_timeout:
-                self.state = 'HALF_OPEN'
+        """Admit a request - in HALF_OPEN exactly one caller gets through as the probe"""
+        with self.lock:
+            if self.state == 'CLOSED':
                 return True
-            return False
-        elif self.state == 'HALF_OPEN':
-            return True
+            elif self.state == 'OPEN':
+                if time.time() - self.last_failure_time > self.recovery_timeout:
+                    self.state = 'HALF_OPEN'
+                    self.probe_started = time.time()
+                    return True
+                return False
+            elif self.state == 'HALF_OPEN':
+                # A probe that never reported back (e.g. its thread died) is replaced
+                if time.time() - self.probe_started > self.recovery_timeout:
+                    self.probe_started = time.time()
+                    return True
+                return False
+    
+    def is_open(self) -> bool:
+        with self.lock:
+            return self.state == 'OPEN'
+    
+    def wait_until_ready(self, poll_interval: float = 5):
+        """Block until can_execute could admit a request, without claiming the probe"""
+        logging.warning("Circuit breaker open - waiting for Riot API to recover")
+        while True:
+            with self.lock:
+                now = time.time()
+                if self.state == 'CLOSED':
+                    return
+                if self.state == 'OPEN' and now - self.last_failure_time > self.recovery_timeout:
+                    return
+                if self.state == 'HALF_OPEN' and now - self.probe_started > self.recovery_timeout:
+                    return
+            time.sleep(poll_interval)
     
     def on_success(self):
-        self.failure_count = 0
-        self.state = 'CLOSED'
+        with self.lock:
+            self.failure_count = 0
+            self.state = 'CLOSED'
+            self.probe_started = None
     
     def on_failure(self):
-        self.failure_count += 1
-        self.last_failure_time = time.time()
-        
-        if self.failure_count >= self.failure_threshold:
-            self.state = 'OPEN'
-            logging.warning(f"Circuit breaker opened after {self.failure_count} failures")
+        with self.lock:
+            self.failure_count += 1
+            self.last_failure_time = time.time()
+            
+            if self.state == 'HALF_OPEN':
+                # Probe failed - back to OPEN for another recovery_timeout
+                self.state = 'OPEN'
+                self.probe_started = None
+                logging.warning("Circuit breaker probe failed - reopening")
+            elif self.failure_count >= self.failure_threshold and self.state != 'OPEN':
+                self.state = 'OPEN'
+                logging.warning(f"Circuit breaker opened after {self.failure_count} failures")
+
+# Trips after repeated 429/5xx/connection failures so an upstream outage fails fast
+circuit_breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=60)
 
 def handle_api_response(response, func_name, player_id=None):
     """Enhanced response handler"""
@@ -209,114 +427,26 @@ def handle_api_response(response, func_name, player_id=None):
     else:
         return response
 
-def process_match_timeline(match_id, api_key):
-    """Process a single match timeline"""
-    result = match_timeline(match_id, api_key)
-    return result
-
-def process_match(match_id, api_key):
-    """Process a single match"""
-    result = match(match_id, api_key)
-    return result
-    
-def champion_mastery(puuid, championid, key, retries=3):
-    mastery = None
-    url = None  # Initialize url variable
-
-    # Recursive limit
-    if retries <= 0:
-        error_info = {
+def champion_mastery(puuid: str, championid: int, key: str, retries: int = 3) -> Dict:
+    """Champion mastery with smart rate limiting; error placeholders on failure"""
+    url = CHAMPION_MASTERY_URL.format(puuid=quote(puuid, safe=''), championid=championid)
+    mastery = make_api_request_with_smart_backoff(url, retries, params={'api_key': key})
+    if mastery is None:
+        logging.error(f"Failed to retrieve champion mastery for puuid {puuid}")
+        return {
             "championLevel": "Error",
             "championPoints": "Error"
         }
-        if mastery and 'status' in mastery:
-            error_info["championLevel"] = f"Error{mastery['status']['status_code']}"
-            error_info["championPoints"] = f"Error{mastery['status']['status_code']}"
-            logging.error(f"Error {mastery['status']['status_code']}: {mastery['status']['message']} From url: {url}")
-        else:
-            logging.error(f"Failed to retrieve champion mastery for puuid {puuid} after all retries")
-        print("server error from champion mastery request")
-        return error_info
-    
-    try:
-        url = ('https://na1.api.riotgames.com/lol/champion-mastery/v4/champion-masteries/by-puuid/' + puuid +
-                '/by-champion/' + str(championid) +'?api_key=' + key)
-        response = requests.get(url)  # Fixed typo: reponse -> response
-        mastery = response.json()
-    except requests.exceptions.RequestException as e:
-        logging.error(f"An error occurred: {e}", exc_info=True)
-        time.sleep(120)
-        return champion_mastery(puuid, championid, key, retries-1)
-
-    # Check for response errors
-    try:
-        # Check for rate limit and server errors (500-504)
-        if mastery['status']['status_code'] >= 429:
-            time.sleep(120)
-            print("retrying mastery request")
-            return champion_mastery(puuid, championid, key, retries-1)
-
-        # Check for client errors or unsupported media errors
-        if mastery['status']['status_code'] <= 415:
-            error_info = {
-                'championLevel': f"Error{mastery['status']['status_code']}",
-                'championPoints': f"Error{mastery['status']['status_code']}"
-            }
-            print("client error from mastery request")
-            logging.error(f"Error {mastery['status']['status_code']}: {mastery['status']['message']} From url: {url}")
-            return error_info
-    
-    # KeyError because 'status' won't be in dictionary (successful response)
-    except KeyError:
-        return mastery
+    return mastery
 
-def summoner_level(puuid, key, retries=3):
-    summoner_info = None
-    url = None  # Initialize url variable
-
-    # Recursive limit
-    if retries <= 0:
-        error_info = {
+def summoner_level(puuid: str, key: str, retries: int = 3) -> Dict:
+    """Summoner info with smart rate limiting; error placeholders on failure"""
+    url = SUMMONER_URL.format(puuid=quote(puuid, safe=''))
+    summoner_info = make_api_request_with_smart_backoff(url, retries, params={'api_key': key})
+    if summoner_info is None:
+        logging.error(f"Failed to retrieve summoner info for puuid {puuid}")
+        return {
             "summonerLevel": "Error",
             "revisionDate": "Error"
         }
-        if summoner_info and 'status' in summoner_info:
-            error_info["summonerLevel"] = f"Error{summoner_info['status']['status_code']}"
-            error_info["revisionDate"] = f"Error{summoner_info['status']['status_code']}"
-            logging.error(f"Error {summoner_info['status']['status_code']}: {summoner_info['status']['message']} From url: {url}")
-        else:
-            logging.error(f"Failed to retrieve summoner info for puuid {puuid} after all retries")
-        print("server error from summoner info request")
-        return error_info
-        
-    try:
-        url = ('https://na1.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/' + puuid + '?api_key=' + key)
-        response = requests.get(url)  # Fixed typo: reponse -> response
-        summoner_info = response.json()
-    except requests.exceptions.RequestException as e:
-        logging.error(f"An error occurred: {e}", exc_info=True)
-        time.sleep(120)
-        return summoner_level(puuid, key, retries-1)
-
-    # Check for response errors
-    try:
-        # Check for rate limit errors or 500-504 server errors
-        if summoner_info['status']['status_code'] >= 429:
-            time.sleep(120)
-            print("retrying summoner information request")
-            return summoner_level(puuid, key, retries-1)
-        
-        # Check for client errors, or unauthorized requests
-        if summoner_info['status']['status_code'] <= 415:
-            error_info = {
-                "summonerLevel": f"Error{summoner_info['status']['status_code']}",
-                "revisionDate": f"Error{summoner_info['status']['status_code']}"
-            }
-            logging.error(f"Error {summoner_info['status']['status_code']}: {summoner_info['status']['message']} From url: {url}")
-            print("client error from summoner info request")
-            return error_info
-
-    # KeyError because 'status' won't be in dictionary (successful response)
-    except KeyError:
-        return summoner_info
-    
+    return summoner_info
@@ -1,92 +1,91 @@
-from collections import deque
+import re
+
+# Leaf paths containing any of these are dropped from the flattened output
+SKIP_KEYWORDS = ('legendaryItemUsed', 'SWARM', 'playerAugment', 'PlayerScore')
+# None of the keywords contain "_", so a match always falls inside a single key
+_SKIP_PATTERN = re.compile('|'.join(map(re.escape, SKIP_KEYWORDS)))
+_skip_keys = {}  # key -> pruned?; like _split_buckets, converges after the first match
+
+def _flatten_into(current, prefix, out):
+    """Copy every leaf under current into out, keyed by prefix + its "_"-joined path"""
+    if isinstance(current, dict):
+        items = current.items()
+    else:
+        items = zip(map(str, range(len(current))), current)
+
+    for key, value in items:
+        #not including legendaryItemUsed - prune the whole subtree
+        skip = _skip_keys.get(key)
+        if skip is None:
+            skip = _skip_keys[key] = _SKIP_PATTERN.search(key) is not None
+        if skip:
+            continue
+        # Containers extend the running prefix; leaves are written with no join
+        if isinstance(value, (dict, list)):
+            _flatten_into(value, prefix + key + '_', out)
+        else:
+            out[prefix + key] = value
 
 def flatten_json(nested_json):
     """Flatten the JSON into a single level (row)."""
     out = {}  # This will hold the flattened result
-    queue = deque([((), nested_json)])  # Initialize a queue with the root of the JSON structure
-
-    while queue:  # Loop through the queue until it's empty
-        path, current = queue.popleft()  # Get the current path and data from the queue
-
-        # If the current element is a dictionary:
-        if isinstance(current, dict):
-            for key, value in current.items():
-                new_path = path + (key,)  # Create a new path by appending the current key
-                queue.append((new_path, value))  # Add the new path and value to the queue
-
-        # If the current element is a list:
-        elif isinstance(current, list):
-            for idx, item in enumerate(current):  # Iterate through each item in the list
-                new_path = path + (str(idx),)  # Create a new path by appending the index
-                queue.append((new_path, item))  # Add the new path and item to the queue
-
-        # If the current element is a value (neither dict nor list):
-        else:
-
-            #not including legendaryItemUsed 
-            path_str = "_".join(path)
-            if any(keyword in path_str for keyword in ['legendaryItemUsed', 'SWARM', 'playerAugment', 'PlayerScore']):
-                continue
-            else:
-                out[path_str] = current  # Use the path_str we already created
-
+    if isinstance(nested_json, (dict, list)):
+        _flatten_into(nested_json, '', out)
+    else:
+        out[''] = nested_json
     return out  # Return the flattened dictionary
 
 def flatten_perks(perks):
-
+    """Flatten rune selections straight into Primary_/Secondary_/statPerks_ columns."""
     out = {}
 
-    Primary  = {}
-    for i, perk in enumerate(perks['styles'][0]['selections']):
-        Primary[f"slot_{i+1}"] = perk
-    Primary['style'] = perks['styles'][0]['style']
-    
-    Secondary = {}
-    for i, perk in enumerate(perks['styles'][1]['selections']):
-        Secondary[f"slot_{i+1}"] = perk
-    Secondary['style'] = perks['styles'][1]['style']
-
-    out['Primary'] = Primary
-    out['Secondary'] = Secondary
-    out['statPerks'] = perks['statPerks']
-    
-    
-    return (flatten_json(out))
+    # Write each selection under its final prefix - no nested dict to build and re-walk
+    for name, style in zip(('Primary', 'Secondary'), perks['styles']):
+        for i, perk in enumerate(style['selections']):
+            _flatten_into(perk, f"{name}_slot_{i+1}_", out)
+        out[f"{name}_style"] = style['style']
+
+    _flatten_into(perks['statPerks'], 'statPerks_', out)
+
+    return out
 
 def flatten_participant_frames(frame):
     
-    championStats = frame['championStats'].copy()
-    frame.pop('championStats')
-    frame.update(championStats)
+    # pop() hands back the nested dict itself, so no copy is needed before merging
+    frame.update(frame.pop('championStats'))
+    frame.update(frame.pop('damageStats'))
 
-    damageStats = frame['damageStats'].copy()
-    frame.pop('damageStats')
-    frame.update(damageStats)
-
-    position = flatten_json(frame['position'])
-    frame.pop('position')
-    frame.update(position)
+    # position is a flat {'x', 'y'} dict - merge it directly rather than running flatten_json
+    frame.update(frame.pop('position'))
 
     return frame
 
+# Key prefix -> bucket in split_json's output (0 = basic stats, the fallback)
+_SPLIT_PREFIXES = re.compile(r'(perks|missions)|(challenges_legendaryItemUsed)|(challenges)')
+_split_buckets = {}  # Riot field names are stable, so this converges after the first match
+
+def _split_bucket(key):
+    match = _SPLIT_PREFIXES.match(key)
+    if match is None:
+        bucket = 0
+    elif match.group(1):
+        bucket = 3
+    elif match.group(2):
+        bucket = 2
+    else:
+        bucket = 1
+    _split_buckets[key] = bucket
+    return bucket
+
 def split_json(flat_dict):
-    legendaryItems = {}
-    challenges = {}
-    perkMissionStats = {}
-    basicStats = {}
+    # basicStats, challenges, legendaryItems, perkMissionStats
+    dicts = [{}, {}, {}, {}]
     
     for key, value in flat_dict.items():
-        if key.startswith('perks') or key.startswith('missions'):
-            perkMissionStats[key] = value
-        elif key.startswith('challenges'):
-            if key.startswith('challenges_legendaryItemUsed'):
-                legendaryItems[key] = value
-            else:
-                challenges[key] = value
-        else:
-            basicStats[key] = value
-
-    dicts = [basicStats, challenges, legendaryItems, perkMissionStats]
+        bucket = _split_buckets.get(key)
+        if bucket is None:
+            bucket = _split_bucket(key)
+        dicts[bucket][key] = value
     
     return dicts
 
@@ -1,5 +1,28 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+
+# api_errors.log is written by one background thread: loggers only enqueue records, so a
+# burst of 429/client-error logging never blocks a fetch worker on file I/O
+_log_queue = queue.SimpleQueue()
+_listener = QueueListener(_log_queue, logging.FileHandler("api_errors.log", delay=True))
+_listener.start()
+atexit.register(_listener.stop)  # drain the queue before logging.shutdown closes the file
+
+def _queued_file_handler(formatter):
+    handler = QueueHandler(_log_queue)
+    handler.setFormatter(formatter)
+    return handler
+
+def configure_root_logging(level=logging.INFO):
+    """Queued stand-in for logging.basicConfig(level=level, filename='api_errors.log')"""
+    root = logging.getLogger()
+    if root.handlers:
+        return  # same as basicConfig: first configuration wins
+    root.setLevel(level)
+    root.addHandler(_queued_file_handler(logging.Formatter(logging.BASIC_FORMAT)))
 
 def get_logger(name: str, level=logging.INFO):
     logger = logging.getLogger(name)
@@ -14,10 +37,8 @@ def get_logger(name: str, level=logging.INFO):
         datefmt="%Y-%m-%d %H:%M:%S"
     )
 
-    # Log to a file
-    file_handler = logging.FileHandler("api_errors.log")
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    # Log to a file (via the background writer)
+    logger.addHandler(_queued_file_handler(formatter))
 
     # Log to stdout
     stream_handler = logging.StreamHandler(sys.stdout)
@@ -1,79 +1,202 @@
 import mysql.connector
+from mysql.connector import errorcode, pooling
 import datetime
 import json
+from itertools import chain
+
+# Rows per multi-row INSERT statement - the same 200 rows executemany already folded into one
+# statement; player_data/timeline_data rows are wide, so bigger risks max_allowed_packet
+INSERT_CHUNK_SIZE = 200
+
+# Table name -> (column count, INSERT prefix, "(%s, ...)" group, full-chunk SQL)
+_insert_sql_cache = {}
+
+# Created on first use - a Lambda container serves one invocation at a time, so a single
+# pooled connection is handed back out on every warm start instead of a new TCP+TLS+auth
+_connection_pool = None
+_pool_config = None  # db_config the pool was built with
+
+def get_pooled_connection(**db_config):
+    """Get a connection from the process-wide pool; close() returns it to the pool"""
+    global _connection_pool, _pool_config
+    # Credentials are re-read from SSM every invocation - a rotated password or new host
+    # replaces the pool (and its stale connection) instead of being silently ignored
+    if _connection_pool is None or db_config != _pool_config:
+        _connection_pool = pooling.MySQLConnectionPool(pool_name='lol_data', pool_size=1, **db_config)
+        _pool_config = dict(db_config)
+        clear_schema_cache()  # a different host/database has its own tables
+    return _connection_pool.get_connection()
+
+# Table name -> column list, shared by every batch in the process (warm Lambdas included)
+_column_cache = {}
+
+# Errors that mean the cached column list / INSERT SQL no longer matches the server
+_STALE_SCHEMA_ERRORS = (errorcode.ER_BAD_FIELD_ERROR, errorcode.ER_NO_SUCH_TABLE)
+
+def clear_schema_cache(table_name=None):
+    """Forget cached columns and INSERT SQL for one table, or for every table"""
+    if table_name is None:
+        _column_cache.clear()
+        _insert_sql_cache.clear()
+    else:
+        _column_cache.pop(table_name, None)
+        _insert_sql_cache.pop(table_name, None)
 
 def get_existing_columns(cursor, table_name):
-    cursor.execute(f"DESCRIBE {table_name}")
-    return [column[0] for column in cursor.fetchall()]
+    # Only DESCRIBE the first time we see a table; add_new_columns keeps the cache current
+    if table_name in _column_cache:
+        return _column_cache[table_name]
+    cursor.execute(f"DESCRIBE {quote_identifier(table_name)}")
+    columns = [column[0] for column in cursor.fetchall()]
+    _column_cache[table_name] = columns
+    return columns
+
+def quote_identifier(name):
+    # Backtick-quote so Riot field names that collide with reserved words still parse
+    return '`' + name.replace('`', '``') + '`'
 
 #helper function
 def add_new_columns(cursor, table_name, new_columns, existing_columns, rows):
-    for column in new_columns:
-        if column not in existing_columns:
-            value = search_rows(rows, column)
-            datatype = infer_column_data_type(value)
-            try:
-                cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {column} {datatype}")
-                print(f"Added new column: {column} datatype: {datatype}")
-            except mysql.connector.Error as e:
-                print(e)
-
-def align_row_data(row, existing_columns):
-    return [row.get(col, None) for col in existing_columns]
+    existing = set(existing_columns)
+    missing = set(new_columns) - existing
+    if not missing:
+        return
+
+    # One pass over the rows finds the widest value for every missing column
+    samples = sample_rows(rows, missing)
+    datatypes = {column: infer_column_data_type(samples.get(column)) for column in missing}
+
+    # Every ADD COLUMN in one ALTER - MySQL rebuilds the table once instead of once per column
+    table_sql = quote_identifier(table_name)
+    clauses = ', '.join(f"ADD COLUMN {quote_identifier(column)} {datatype}" for column, datatype in datatypes.items())
+    try:
+        cursor.execute(f"ALTER TABLE {table_sql} {clauses}")
+        for column, datatype in datatypes.items():
+            print(f"Added new column: {column} datatype: {datatype}")
+        # Keep the cached (and caller's) column list in step with the table
+        existing_columns.extend(datatypes)
+        return
+    except mysql.connector.Error as e:
+        # The combined statement is all-or-nothing - retry one column at a time so one bad column can't block the rest
+        print(f"Combined ALTER failed, adding columns individually: {e}")
+
+    for column, datatype in datatypes.items():
+        try:
+            cursor.execute(f"ALTER TABLE {table_sql} ADD COLUMN {quote_identifier(column)} {datatype}")
+            print(f"Added new column: {column} datatype: {datatype}")
+            existing_columns.append(column)
+        except mysql.connector.Error as e:
+            # Another invocation added it after our DESCRIBE - the column exists, so cache it
+            if e.errno == errorcode.ER_DUP_FIELDNAME:
+                existing_columns.append(column)
+            print(e)
 
 def insert_data_to_mysql(cursor, table_name, rows):
-    # Retrieve the current columns in the table (do this only once)
+    try:
+        _insert_rows(cursor, table_name, rows)
+    except mysql.connector.Error as err:
+        # Schema changed outside this process - re-DESCRIBE on the next call instead of
+        # failing every warm invocation with the stale columns
+        if err.errno in _STALE_SCHEMA_ERRORS:
+            clear_schema_cache(table_name)
+        raise
+    print(f"Inserted {len(rows)} rows into {table_name}")
+
+def _insert_rows(cursor, table_name, rows):
+    # Retrieve the current columns in the table (cached after the first batch)
     existing_columns = get_existing_columns(cursor, table_name)
 
     # Get all unique columns from the rows and identify the missing columns
-    new_columns = set(col for row in rows for col in row.keys())
+    new_columns = set().union(*rows)
     
     # Add missing columns to the table
     add_new_columns(cursor, table_name, new_columns, existing_columns, rows)
     
-    # Align all rows with the existing columns (fill in None for missing columns)
-    aligned_rows = [align_row_data(row, existing_columns) for row in rows]
+    # Snapshot the columns, including any just added - every row is aligned to this order
+    columns = tuple(existing_columns)
 
-    # Prepare the INSERT statement with placeholders for each column
-    placeholders = ', '.join(['%s'] * len(existing_columns))
-    sql = f"INSERT INTO {table_name} ({', '.join(existing_columns)}) VALUES ({placeholders})"
+    for i in range(0, len(rows), INSERT_CHUNK_SIZE):
+        chunk = rows[i:i + INSERT_CHUNK_SIZE]
+        # Each chunk goes out as a single extended INSERT
+        sql = build_insert_sql(table_name, columns, len(chunk))
+        # Align straight into the flat parameter list - map(row.get) fills None for missing columns
+        params = list(chain.from_iterable(map(row.get, columns) for row in chunk))
+        cursor.execute(sql, params)
 
-    # Use executemany to insert all rows at once
-    cursor.executemany(sql, aligned_rows)
-    print(f"Inserted {len(aligned_rows)} rows into {table_name}")
+def build_insert_sql(table_name, columns, row_count):
+    """Multi-row INSERT for row_count rows; full chunks reuse the SQL cached for the table"""
+    cached = _insert_sql_cache.get(table_name)
+    # Columns are only ever appended, so the count identifies the column list
+    if cached is None or cached[0] != len(columns):
+        prefix = f"INSERT INTO {quote_identifier(table_name)} ({', '.join(map(quote_identifier, columns))}) VALUES "
+        row_placeholders = '(' + ', '.join(['%s'] * len(columns)) + ')'
+        full_chunk_sql = prefix + ', '.join([row_placeholders] * INSERT_CHUNK_SIZE)
+        cached = _insert_sql_cache[table_name] = (len(columns), prefix, row_placeholders, full_chunk_sql)
+
+    _, prefix, row_placeholders, full_chunk_sql = cached
+    if row_count == INSERT_CHUNK_SIZE:
+        return full_chunk_sql
+    return prefix + ', '.join([row_placeholders] * row_count)
 
 # Helper function to infer the datatype of a column based on the value
 def infer_column_data_type(value):
-    if isinstance(value, int):
+    # bool first - it is a subclass of int and would otherwise become INT
+    if isinstance(value, bool):
+        return "BOOLEAN"
+    elif isinstance(value, int):
         # Check if the integer value exceeds INT range (-2,147,483,648 to 2,147,483,647)
         if value > 2147483647 or value < -2147483648:
             return "BIGINT"
         else:
             return "INT"
     elif isinstance(value, float):
+        # DECIMAL(10, 2) tops out just under 1e8 - larger magnitudes would fail in strict mode
+        if abs(value) >= 1e8:
+            return "DOUBLE"
         return "DECIMAL(10, 2)"
     elif isinstance(value, str):
         return "VARCHAR(255)"
-    elif isinstance(value, bool):
-        return "BOOLEAN"
     elif value is None:
         return "TEXT"  # For NULL values, TEXT can be used
     else:
         return "VARCHAR(255)"  # Default type for unknown types
     
-def search_rows(rows, key):
-    for dictionary in rows:
-        if key in dictionary:
-            return dictionary[key]
+# Column type widening order for sampled values - anything unlisted sorts with str
+_TYPE_RANK = {bool: 0, int: 1, float: 2, str: 3}
+
+def _value_rank(value):
+    # Among ints/floats the largest magnitude decides INT vs BIGINT, DECIMAL vs DOUBLE
+    return (_TYPE_RANK.get(type(value), 3), abs(value) if type(value) in (int, float) else 0)
 
-    return None
+def sample_rows(rows, keys):
+    """Widest non-None value seen for each of keys across rows, so the inferred type fits them all"""
+    samples = {}
+    int_peaks = {}  # largest int magnitude per key - a float sample must still hold it
+    keys = set(keys)
+    for row in rows:
+        for key in keys.intersection(row):
+            value = row[key]
+            if value is None:
+                continue
+            if type(value) is int:
+                int_peaks[key] = max(int_peaks.get(key, 0), abs(value))
+            current = samples.get(key)
+            if current is None or _value_rank(value) > _value_rank(current):
+                samples[key] = value
+    # Mixed int/float column: widen the float sample to the biggest int so it types as DOUBLE
+    # rather than a DECIMAL(10, 2) the int cannot fit in
+    for key, peak in int_peaks.items():
+        sample = samples[key]
+        if type(sample) is float and peak > abs(sample):
+            samples[key] = float(peak)
+    return samples
 
 def ensure_healthy_connection(conn, cursor):
     try:
         conn.ping(reconnect=False)
         return conn, cursor
     except:
-        logger.warning("⚠️ Connection unhealthy, reconnecting...")
+        print("⚠️ Connection unhealthy, reconnecting...")
         conn.reconnect()
         cursor = conn.cursor()
         return conn, cursor
@@ -38,6 +38,7 @@ setup(
         "mysql-connector==2.2.9",
         "nest-asyncio==1.6.0",
         "numpy==2.2.0",
+        "orjson==3.10.7",
         "packaging==24.2",
         "pandas==2.2.3",
         "parso==0.8.4",
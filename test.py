@@ -1,6 +1,4 @@
-from Utils.S3 import alter_s3_file, check_files
-from Utils.api import match
-from Utils.json import flatten_json
+from Utils.S3 import alter_s3_file
 
 
 